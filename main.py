@@ -1,5 +1,6 @@
-from src.utils import fetch_filings_from_rss, check_new_filings
-from src.logger import logger
+from src.utils import fetch_filings_from_rss, check_new_filings, refresh_ticker_map
+from src.poll_schedule import next_poll_interval, record_disclosures
+from src.logger import logger, configure_logging
 from src.config import (
     TEAMS_WEBHOOK_URL,
     TELEGRAM_BOT_TOKEN,
@@ -8,160 +9,159 @@ from src.config import (
     TWITTER_API_SECRET,
     TWITTER_ACCESS_TOKEN,
     TWITTER_ACCESS_TOKEN_SECRET,
-    SLACK_WEBHOOK_URL
+    SLACK_WEBHOOK_URL,
+    RETRY_BASE_DELAY,
+    MAX_RETRY_DELAY,
+    TWITTER_BIO_INTERVAL
 )
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import time
+import random
 import importlib
 
-# Try to import and configure notification modules
+# Notification modules, populated by load_notification_modules(); each channel's
+# function posts a list of disclosures in as few messages as the channel allows
 notification_modules = {}
 
-# Check Teams module
-if TEAMS_WEBHOOK_URL:
-    try:
-        from src.teams_poster import post_to_teams
-        notification_modules['teams'] = post_to_teams
-        logger.info("Teams notification module loaded and configured successfully")
-    except ImportError:
-        logger.info("Teams notification module not available (module import failed)")
-else:
-    logger.info("Teams notification module not configured in .env")
+# Notification channels: (display name, configured in .env, module, {notification_modules key: function})
+NOTIFIERS = [
+    ('Teams', bool(TEAMS_WEBHOOK_URL), 'src.teams_poster', {'teams': 'post_batch_to_teams'}),
+    ('Telegram', bool(TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID), 'src.telegram_poster',
+     {'telegram': 'send_telegram_batch'}),
+    ('Twitter', all([TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET]),
+     'src.twitter_poster', {'twitter': 'tweet_batch', 'twitter_bio': 'update_twitter_bio'}),
+    ('Slack', bool(SLACK_WEBHOOK_URL), 'src.slack_poster', {'slack': 'post_batch_to_slack'})
+]
 
-# Check Telegram module
-if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
-    try:
-        from src.telegram_poster import send_telegram_message
-        notification_modules['telegram'] = send_telegram_message
-        logger.info("Telegram notification module loaded and configured successfully")
-    except ImportError:
-        logger.info("Telegram notification module not available (module import failed)")
-else:
-    logger.info("Telegram notification module not configured in .env")
+# (name, function) of the channels disclosures are posted to, fixed by load_notification_modules()
+active_notifiers = ()
 
-# Check Twitter module
-if all([TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET]):
-    try:
-        from src.twitter_poster import tweet, update_twitter_bio
-        notification_modules['twitter'] = tweet
-        notification_modules['twitter_bio'] = update_twitter_bio
-        logger.info("Twitter notification module loaded and configured successfully")
-    except ImportError as e:
-        logger.error(f"Failed to initialize Twitter module: {e}")
-else:
-    logger.info("Twitter notification module not configured in .env")
+# Display names of the notification_modules keys
+CHANNEL_LABELS = {name: label for label, _, _, functions in NOTIFIERS for name in functions}
 
-# Check Slack module
-if SLACK_WEBHOOK_URL:
-    try:
-        from src.slack_poster import post_to_slack
-        notification_modules['slack'] = post_to_slack
-        logger.info("Slack notification module loaded and configured successfully")
-    except ImportError as e:
-        logger.error(f"Failed to initialize Slack module: {e}")
-else:
-    logger.info("Slack notification module not configured in .env")
+# Posts to the different channels run in parallel; created once and reused for every disclosure
+notification_executor = ThreadPoolExecutor(max_workers=len(NOTIFIERS))
 
-# Log active modules
-if notification_modules:
-    logger.info(f"Active notification modules: {', '.join(notification_modules.keys())}")
-else:
-    logger.warning("No notification modules available")
+def load_notification_modules():
+    """Import and register the notification modules configured in .env."""
+    global active_notifiers
+    for label, configured, module_path, functions in NOTIFIERS:
+        if not configured:
+            logger.info("%s notification module not configured in .env", label)
+            continue
+        try:
+            module = importlib.import_module(module_path)
+            notification_modules.update({name: getattr(module, function) for name, function in functions.items()})
+            logger.info("%s notification module loaded and configured successfully", label)
+        except (ImportError, AttributeError) as e:
+            logger.error("Failed to initialize %s module: %s", label, e)
 
-def notify_disclosure(disclosure):
-    """Send notifications through available notification modules."""
-    company_name = disclosure['company_name']
-    cik_number = disclosure['cik']
-    ticker_symbol = disclosure.get('ticker', '')
-    document_link = disclosure['filing_url']
-    pubDate = disclosure['filing_date']
+    # twitter_bio is called once per cycle, not per batch of disclosures
+    active_notifiers = tuple((name, post) for name, post in notification_modules.items() if name != 'twitter_bio')
 
-    # Always log to console
-    logger.info(f"New cybersecurity disclosure found:")
-    logger.info(f"Company: {company_name} (CIK: {cik_number}, Ticker: {ticker_symbol})")
-    logger.info(f"Published: {pubDate}")
-    logger.info(f"Document: {document_link}")
+    # Log active modules
+    if notification_modules:
+        logger.info("Active notification modules: %s", ', '.join(notification_modules.keys()))
+    else:
+        logger.warning("No notification modules available")
 
-    # Try each notification module
-    if 'teams' in notification_modules:
-        try:
-            logger.info(f"Posting to Teams: {company_name}")
-            if notification_modules['teams'](company_name, cik_number, ticker_symbol, document_link, pubDate):
-                logger.info("Posted to Teams successfully")
-            else:
-                logger.error("Failed to post to Teams")
-        except Exception as e:
-            logger.error(f"Error posting to Teams: {e}")
+def _post(name, post, disclosures):
+    """Post a batch of disclosures to one channel.
+    Returns:
+        tuple: (channel name, True if the post succeeded)
+    """
+    label = CHANNEL_LABELS.get(name, name)
+    try:
+        if post(disclosures):
+            return name, True
+        logger.error("Failed to post to %s", label)
+    except Exception as e:
+        logger.error("Error posting to %s: %s", label, e)
+    return name, False
 
-    if 'telegram' in notification_modules:
-        try:
-            logger.info(f"Posting to Telegram: {company_name}")
-            if notification_modules['telegram'](company_name, cik_number, ticker_symbol, document_link, pubDate):
-                logger.info("Posted to Telegram successfully")
-            else:
-                logger.error("Failed to post to Telegram")
-        except Exception as e:
-            logger.error(f"Error posting to Telegram: {e}")
+class _DispatchSummary:
+    """Per-channel dispatch results, formatted only when a log record is."""
+    def __init__(self, results):
+        self.results = results
 
-    if 'twitter' in notification_modules:
-        try:
-            logger.info(f"Posting to Twitter: {company_name}")
-            if notification_modules['twitter'](company_name, cik_number, ticker_symbol, document_link, pubDate):
-                logger.info("Posted to Twitter successfully")
-            else:
-                logger.error("Failed to post to Twitter")
-        except Exception as e:
-            logger.error(f"Error posting to Twitter: {e}")
+    def __str__(self):
+        return ', '.join(
+            f"{CHANNEL_LABELS.get(name, name)} {'ok' if ok else 'failed'}" for name, ok in self.results.items())
 
-    if 'slack' in notification_modules:
-        try:
-            logger.info(f"Posting to Slack: {company_name}")
-            if notification_modules['slack'](company_name, cik_number, ticker_symbol, document_link, pubDate):
-                logger.info("Posted to Slack successfully")
-            else:
-                logger.error("Failed to post to Slack")
-        except Exception as e:
-            logger.error(f"Error posting to Slack: {e}")
+def notify_disclosures(disclosures):
+    """Send notifications for a cycle's disclosures through available notification modules.
+    Returns:
+        dict: Whether the post succeeded, per channel name
+    """
+    # Always log to console
+    for disclosure in disclosures:
+        logger.info("New cybersecurity disclosure found: %s (CIK: %s, Ticker: %s), published %s, document %s",
+                    disclosure['company_name'], disclosure['cik'], disclosure.get('ticker', ''),
+                    disclosure['filing_date'], disclosure['filing_url'])
+
+    # Post to every channel at once, so a slow channel doesn't hold up the others
+    futures = [
+        notification_executor.submit(_post, name, post, disclosures)
+        for name, post in active_notifiers
+    ]
+    results = dict(future.result() for future in as_completed(futures))
+    if results:
+        logger.info("Dispatch results: %s", _DispatchSummary(results))
+    return results
 
 def monitor_sec_feed():
     """Monitor the SEC RSS feed for new 8-K filings."""
+    consecutive_errors = 0
+    last_bio_update = None
     while True:
         try:
             logger.info("Starting new check cycle...")
+            refresh_ticker_map()
             logger.info("Fetching SEC RSS feed for 8-K filings...")
             
             # Fetch and process filings
             filings = fetch_filings_from_rss()
-            if not filings:
-                logger.warning("No filings found in RSS feed")
-                continue
+            if filings:
+                logger.info("Found %s filings to inspect", len(filings))
+                logger.info("Inspecting documents for cybersecurity disclosures...")
                 
-            logger.info(f"Found {len(filings)} filings to inspect")
-            logger.info("Inspecting documents for cybersecurity disclosures...")
-            
-            # Check for new disclosures
-            new_disclosures = check_new_filings(filings)
-            
-            # Update Twitter bio with last check time
-            if 'twitter_bio' in notification_modules:
-                notification_modules['twitter_bio'](datetime.utcnow())
-            
-            # Process any new disclosures
-            if new_disclosures:
-                logger.info(f"Found {len(new_disclosures)} new cybersecurity disclosure(s)")
-                for disclosure in new_disclosures:
-                    notify_disclosure(disclosure)
+                # Check for new disclosures
+                new_disclosures = check_new_filings(filings)
+                
+                # Update Twitter bio with last check time, at most every TWITTER_BIO_INTERVAL
+                # since the feed is now checked far more often than that
+                if 'twitter_bio' in notification_modules and (
+                        last_bio_update is None or time.monotonic() - last_bio_update >= TWITTER_BIO_INTERVAL):
+                    notification_modules['twitter_bio'](datetime.utcnow())
+                    last_bio_update = time.monotonic()
+                
+                # Process any new disclosures
+                if new_disclosures:
+                    logger.info("Found %s new cybersecurity disclosure(s)", len(new_disclosures))
+                    record_disclosures(new_disclosures)
+                    notify_disclosures(new_disclosures)
+                else:
+                    logger.info("No new cybersecurity disclosures found in this batch")
             else:
-                logger.info("No new cybersecurity disclosures found in this batch")
+                logger.info("No new filings to inspect")
                 
-            logger.info("Check cycle completed. Waiting 10 minutes before next check...")
-            time.sleep(600)  # Wait 10 minutes before next check
+            consecutive_errors = 0
+            poll_interval = next_poll_interval()
+            logger.info("Check cycle completed. Waiting %.0f seconds before next check...", poll_interval)
+            time.sleep(poll_interval)
             
         except Exception as e:
-            logger.error(f"Error in monitoring loop: {e}")
-            logger.info("Waiting 10 minutes before retry...")
-            time.sleep(600)  # Wait 10 minutes before retry
+            logger.error("Error in monitoring loop: %s", e)
+            # Back off exponentially, with jitter so separate deployments don't retry in lockstep
+            consecutive_errors += 1
+            retry_delay = min(MAX_RETRY_DELAY, RETRY_BASE_DELAY * 2 ** (consecutive_errors - 1))
+            retry_delay += random.uniform(0, RETRY_BASE_DELAY)
+            logger.info("Waiting %.0f seconds before retry...", retry_delay)
+            time.sleep(retry_delay)
 
 if __name__ == "__main__":
+    configure_logging()
     logger.info("SECurityTr8Ker starting up...")
+    load_notification_modules()
     monitor_sec_feed()
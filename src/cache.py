@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from src.logger import logger
+
+# Minimum seconds between two prunes of the same cache directory
+_PRUNE_INTERVAL = 3600
+
+class FileCache:
+    """On-disk cache of HTTP response bodies with a time-to-live.
+
+    Each key is stored as a JSON file holding the body together with the
+    ETag / Last-Modified validators, so stale entries can be revalidated with
+    a conditional GET instead of being downloaded again. File names are hashes
+    of the keys, and caches given a max_age or max_entries are pruned when
+    created and then at most hourly as entries are written.
+    """
+
+    def __init__(self, cache_dir, ttl=3600, max_age=None, max_entries=None):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache files
+            ttl (int): Seconds an entry is served without revalidation
+            max_age (int): Seconds after its last write an entry is deleted, or None to keep it
+            max_entries (int): Most entries kept; the least recently written go first
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._last_prune = None
+        self._prune_lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.prune()
+
+    def _path(self, key):
+        # Hash the key so any two distinct keys map to distinct file names
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key):
+        """Return the cached entry for key (fresh or stale), or None."""
+        try:
+            with open(self._path(key), 'r') as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", key, e)
+            return None
+        return entry if isinstance(entry, dict) and entry.get('key') == key else None
+
+    def is_fresh(self, entry):
+        """Check whether an entry is still within its TTL."""
+        return entry is not None and time.time() - entry.get('ts', 0) < self.ttl
+
+    def set(self, key, body, etag=None, last_modified=None):
+        """Store body under key along with its HTTP validators."""
+        entry = {
+            'key': key,
+            'ts': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': body
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write cache entry %s: %s", key, e)
+        self._maybe_prune()
+        return entry
+
+    def touch(self, entry, key):
+        """Mark a revalidated (HTTP 304) entry as fresh again."""
+        return self.set(key, entry['body'], entry.get('etag'), entry.get('last_modified'))
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Failed to remove cache file %s: %s", path, e)
+
+    def prune(self):
+        """Delete entries older than max_age, then the oldest beyond max_entries."""
+        if self.max_age is None and self.max_entries is None:
+            return
+        self._last_prune = time.monotonic()
+
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                modified = os.path.getmtime(path)
+            except OSError:
+                continue
+            if not name.endswith('.json'):
+                # Temp file; only remove leftovers of interrupted writes, not ones in progress
+                if now - modified > _PRUNE_INTERVAL:
+                    self._remove(path)
+            elif self.max_age is not None and now - modified > self.max_age:
+                self._remove(path)
+            else:
+                entries.append((modified, path))
+
+        if self.max_entries is not None and len(entries) > self.max_entries:
+            entries.sort()
+            for _, path in entries[:len(entries) - self.max_entries]:
+                self._remove(path)
+
+    def _maybe_prune(self):
+        """Prune at most once per _PRUNE_INTERVAL, from whichever thread writes first."""
+        if self._last_prune is not None and time.monotonic() - self._last_prune < _PRUNE_INTERVAL:
+            return
+        if self._prune_lock.acquire(blocking=False):
+            try:
+                self.prune()
+            finally:
+                self._prune_lock.release()
@@ -9,14 +9,24 @@ logger = logging.getLogger()
 # Load environment variables from .env file
 env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
 if not os.path.exists(env_path):
-    logger.error(f".env file not found at {env_path}")
+    logger.error(".env file not found at %s", env_path)
 else:
     load_dotenv(env_path)
     logger.info(".env file loaded successfully")
 
 # SEC API Configuration
 RSS_URL = 'https://www.sec.gov/Archives/edgar/usgaap.rss.xml'
-REQUEST_INTERVAL = 0.1  # Time to wait between requests to SEC API (seconds)
+FORM_TYPES = frozenset({'8-K', '8-K/A'})  # Filing forms inspected for disclosures
+REQUESTS_PER_SECOND = 10  # Maximum request rate to SEC API (SEC fair access limit)
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) timeout for requests to SEC API (seconds)
+POLL_INTERVAL = 60  # Time to wait between checks of the RSS feed (seconds)
+MAX_POLL_INTERVAL = 600  # Longest wait between checks during hours with few past disclosures (seconds)
+MIN_POLL_SAMPLES = 50  # Past disclosures needed before quiet hours are polled less often
+RETRY_BASE_DELAY = 5  # Wait after the first failed check cycle, doubled on each further failure (seconds)
+MAX_RETRY_DELAY = 600  # Longest wait between retries of failed check cycles (seconds)
+TWITTER_BIO_INTERVAL = 600  # Shortest time between updates of the Twitter bio's last check time (seconds)
+MAX_CONCURRENT_REQUESTS = 8  # Maximum number of filings inspected in parallel
+MAX_DOCUMENT_BYTES = 50 * 1024 * 1024  # Filing documents larger than this are not downloaded
 
 # Use USER_AGENT from .env if provided, otherwise use default
 USER_AGENT = os.getenv('USER_AGENT', "SECurityTr8Ker/1.0 (your-email@example.com)")
@@ -40,16 +50,29 @@ TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 # Slack Configuration
 SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
 
+# Timeout for posts to notification channels (seconds)
+NOTIFICATION_TIMEOUT = 10
+
 # File Storage
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DISCLOSURES_FILE = os.path.join(BASE_DIR, "disclosures.json")
 LOG_DIR = os.path.join(BASE_DIR, "logs")
+CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+SUBMISSIONS_CACHE_TTL = 3600  # Seconds before cached SEC submissions JSON is revalidated
+INSPECTIONS_CACHE_TTL = 86400  # Seconds a filing document's inspection result is reused
+CACHE_MAX_AGE = 7 * 86400  # Seconds after which unused cache entries are deleted
+CACHE_MAX_ENTRIES = 10000  # Most entries kept in each per-key cache directory
+
+# Bulk CIK to ticker mapping published by the SEC, refreshed daily
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+COMPANY_TICKERS_CACHE_TTL = 86400
 
 # Ensure log directory exists
 os.makedirs(LOG_DIR, exist_ok=True)
 
 # Log configuration
 LOG_FILE_PATH = os.path.join(LOG_DIR, 'debug.log')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()  # Terminal log level; the log file always captures DEBUG
 
 # Search Terms for cybersecurity incidents
 SEARCH_TERMS = {
@@ -0,0 +1,38 @@
+def disclosure_fields(disclosure):
+    """Unpack a saved disclosure into the arguments the notification posters take.
+    Returns:
+        tuple: (company_name, cik_number, ticker_symbol, document_link, pubDate)
+    """
+    return (
+        disclosure.get('company_name', ''),
+        disclosure.get('cik', ''),
+        disclosure.get('ticker', ''),
+        disclosure.get('filing_url', ''),
+        disclosure.get('filing_date', '')
+    )
+
+def group_messages(messages, max_length, separator="\n\n"):
+    """Group messages so each group joined with separator is at most max_length long.
+    A single message longer than max_length gets a group of its own.
+    Returns:
+        list: Lists of messages, in their original order
+    """
+    groups = []
+    current = []
+    length = 0
+    for message in messages:
+        if current and length + len(separator) + len(message) > max_length:
+            groups.append(current)
+            current = []
+        length = length + len(separator) + len(message) if current else len(message)
+        current.append(message)
+    if current:
+        groups.append(current)
+    return groups
+
+def join_messages(messages, max_length, separator="\n\n"):
+    """Join messages into as few texts as possible, each at most max_length long.
+    Returns:
+        list: The joined texts
+    """
+    return [separator.join(group) for group in group_messages(messages, max_length, separator)]
@@ -1,32 +1,64 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import colorlog
-from src.config import LOG_FILE_PATH, LOG_DIR
+from src.config import LOG_FILE_PATH, LOG_DIR, LOG_LEVEL
 import os
 
-# Ensure the logs directory exists
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
-
-# Initialize the root logger to capture DEBUG level logs
-logger = colorlog.getLogger()
-logger.setLevel(logging.DEBUG)  # Capture everything at DEBUG level and above
-
-# Setting up colored logging for terminal
-terminal_handler = colorlog.StreamHandler()
-terminal_handler.setFormatter(colorlog.ColoredFormatter(
-    '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'red,bg_white',
-    }))
-terminal_handler.setLevel(logging.INFO)  # Terminal to show INFO and above
-logger.addHandler(terminal_handler)
-
-# Setting up logging to file to capture DEBUG and above
-file_handler = logging.FileHandler(LOG_FILE_PATH)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-file_handler.setLevel(logging.DEBUG)  # File to capture everything at DEBUG level
-logger.addHandler(file_handler)
+# Application logger; output is routed by the handlers configure_logging() puts on the root logger
+logger = logging.getLogger('securitytr8ker')
+
+def configure_logging():
+    """Set up terminal and file logging on the root logger.
+
+    Records are handed to a background listener thread through a queue, so
+    worker threads never block on terminal or disk writes.
+
+    Call this once from an entry point. Repeated calls are ignored so
+    handlers never stack up and duplicate every log line.
+    """
+    root_logger = colorlog.getLogger()
+    if root_logger.handlers:
+        return
+
+    # Ensure the logs directory exists
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    # Capture DEBUG level logs and above
+    root_logger.setLevel(logging.DEBUG)
+
+    # Setting up colored logging for terminal
+    terminal_handler = colorlog.StreamHandler()
+    terminal_handler.setFormatter(colorlog.ColoredFormatter(
+        '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white',
+        }))
+    # Terminal to show LOG_LEVEL (INFO by default) and above
+    try:
+        terminal_handler.setLevel(LOG_LEVEL)
+        unknown_level = False
+    except ValueError:
+        terminal_handler.setLevel(logging.INFO)
+        unknown_level = True
+
+    # Setting up logging to file to capture DEBUG and above
+    file_handler = logging.FileHandler(LOG_FILE_PATH, delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    file_handler.setLevel(logging.DEBUG)  # File to capture everything at DEBUG level
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, terminal_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    # Flush queued records before the interpreter exits
+    atexit.register(listener.stop)
+
+    if unknown_level:
+        logger.warning("Unknown LOG_LEVEL %s, using INFO", LOG_LEVEL)
@@ -0,0 +1,65 @@
+import math
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+import pytz
+from src.config import POLL_INTERVAL, MAX_POLL_INTERVAL, MIN_POLL_SAMPLES
+from src.utils import load_disclosures
+from src.logger import logger
+
+EASTERN = pytz.timezone('US/Eastern')
+
+# Disclosures per hour of day, loaded from disclosures.json on first use and then
+# kept current by record_disclosures(); poll intervals are derived from it
+_hour_counts = None
+_intervals = None
+
+def add_to_histogram(counts, disclosures):
+    """Count disclosures into counts by the hour of day (US/Eastern) they were published."""
+    for disclosure in disclosures:
+        try:
+            published = parsedate_to_datetime(disclosure.get('filing_date', ''))
+        except (TypeError, ValueError):
+            continue
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=pytz.utc)
+        counts[published.astimezone(EASTERN).hour] += 1
+    return counts
+
+def poll_intervals(counts):
+    """Seconds to wait between polls for each hour of the day.
+
+    The expected delay until a disclosure is detected is smallest when each
+    hour's poll rate is proportional to the square root of its share of
+    disclosures. The busiest hour is polled every POLL_INTERVAL; quieter hours
+    are stretched from there by that rule, up to MAX_POLL_INTERVAL. Idle polls
+    cost only a 304, so busy hours are never polled less often than before.
+    """
+    # Add-one smoothing so hours without past disclosures are still polled
+    busiest = max(counts) + 1
+    return [min(MAX_POLL_INTERVAL, POLL_INTERVAL * math.sqrt(busiest / (count + 1))) for count in counts]
+
+def record_disclosures(disclosures):
+    """Add newly saved disclosures to the histogram the poll schedule is based on."""
+    global _intervals
+    if _hour_counts is None:
+        # Not loaded yet; the first load reads them from disclosures.json
+        return
+    add_to_histogram(_hour_counts, disclosures)
+    _intervals = None
+
+def next_poll_interval(now=None):
+    """Seconds to wait before the next RSS check.
+    Falls back to POLL_INTERVAL until enough disclosures have been recorded.
+    """
+    global _hour_counts, _intervals
+    if _hour_counts is None:
+        _hour_counts = add_to_histogram([0] * 24, load_disclosures())
+    if sum(_hour_counts) < MIN_POLL_SAMPLES:
+        return POLL_INTERVAL
+    if _intervals is None:
+        _intervals = poll_intervals(_hour_counts)
+
+    hour = (now or datetime.now(EASTERN)).astimezone(EASTERN).hour
+    interval = _intervals[hour]
+    logger.debug("Adaptive poll interval for hour %s: %.0f seconds", hour, interval)
+    return interval
@@ -0,0 +1,33 @@
+import threading
+import time
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how many requests start per second.
+
+    Up to `burst` requests may start back to back; after that callers are
+    spaced out so the long-run rate never exceeds `rate` per second.
+    """
+
+    def __init__(self, rate=10, burst=10):
+        """
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Maximum number of tokens held at once
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it becomes available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now so waiting threads are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
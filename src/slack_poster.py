@@ -1,15 +1,22 @@
 import requests
-from src.config import SLACK_WEBHOOK_URL
-from src.logger import logger
+from src.config import SLACK_WEBHOOK_URL, NOTIFICATION_TIMEOUT
+from src.formatting import disclosure_fields, join_messages
+from src.logger import logger, configure_logging
 
-def post_to_slack(company_name, cik_number, ticker_symbol, document_link, pubDate):
+# Reused for every post so the connection to the webhook endpoint stays open
+SESSION = requests.Session()
+
+# Slack truncates message text beyond this many characters
+MAX_MESSAGE_LENGTH = 40000
+
+def format_slack_message(company_name, cik_number, ticker_symbol, document_link, pubDate):
     # Add a Google search link for the ticker symbol if available
     ticker_part = (
         f" (Ticker: <https://www.google.com/search?q=%24{ticker_symbol}+ticker|${ticker_symbol}>)"
         if ticker_symbol else ""
     )
     
-    message = (
+    return (
         f"*Cybersecurity Incident Disclosure*\n"
         f"Published on: {pubDate}\n"
         f"Company: *{company_name}*\n"
@@ -17,18 +24,37 @@ def post_to_slack(company_name, cik_number, ticker_symbol, document_link, pubDat
         f"<{document_link}|View SEC Filing>"
     )
 
+def send_slack_message(message):
     payload = {"text": message}
     headers = {'Content-Type': 'application/json'}
-    response = requests.post(SLACK_WEBHOOK_URL, json=payload, headers=headers)
+    try:
+        response = SESSION.post(SLACK_WEBHOOK_URL, json=payload, headers=headers, timeout=NOTIFICATION_TIMEOUT)
+    except requests.RequestException as e:
+        logger.error("Failed to post to Slack: %s", e)
+        return False
 
     if response.status_code != 200:
-        logger.error(f"Failed to post to Slack: {response.text}")
+        logger.error("Failed to post to Slack: %s", response.text)
         return False
     else:
-        logger.info(f"Slack posted successfully: {response}")
+        logger.info("Slack posted successfully: %s", response)
         return True
 
+def post_to_slack(company_name, cik_number, ticker_symbol, document_link, pubDate):
+    return send_slack_message(format_slack_message(company_name, cik_number, ticker_symbol, document_link, pubDate))
+
+def post_batch_to_slack(disclosures):
+    """Post several disclosures in as few Slack messages as possible.
+    Returns:
+        bool: True if every message was posted
+    """
+    messages = [format_slack_message(*disclosure_fields(disclosure)) for disclosure in disclosures]
+    # Keep posting the remaining messages if one of them fails
+    results = [send_slack_message(text) for text in join_messages(messages, MAX_MESSAGE_LENGTH)]
+    return all(results)
+
 if __name__ == "__main__":
+    configure_logging()
     # Example usage
     post_to_slack(
         "Example Company",
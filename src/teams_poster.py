@@ -1,6 +1,13 @@
 import requests
-from src.config import TEAMS_WEBHOOK_URL
-from src.logger import logger
+from src.config import TEAMS_WEBHOOK_URL, NOTIFICATION_TIMEOUT
+from src.formatting import disclosure_fields
+from src.logger import logger, configure_logging
+
+# Reused for every post so the connection to the webhook endpoint stays open
+SESSION = requests.Session()
+
+# Disclosures per adaptive card, keeping each card well under the Teams message size limit
+MAX_DISCLOSURES_PER_CARD = 10
 
 def post_to_teams(company_name, cik_number, ticker_symbol, document_link, pubDate):
     """Post a notification to Microsoft Teams.
@@ -15,35 +22,68 @@ def post_to_teams(company_name, cik_number, ticker_symbol, document_link, pubDat
     Returns:
         bool: True if successful, False otherwise
     """
+    card_body = [_title_block()] + _disclosure_blocks(company_name, cik_number, ticker_symbol, document_link, pubDate)
+    return send_teams_card(card_body)
+
+def post_batch_to_teams(disclosures):
+    """Post several disclosures to Microsoft Teams, up to MAX_DISCLOSURES_PER_CARD per card.
+    
+    Args:
+        disclosures (list): Disclosures as saved by check_new_filings
+    
+    Returns:
+        bool: True if every card was posted, False otherwise
+    """
+    results = []
+    for start in range(0, len(disclosures), MAX_DISCLOSURES_PER_CARD):
+        card_body = [_title_block()]
+        for disclosure in disclosures[start:start + MAX_DISCLOSURES_PER_CARD]:
+            card_body.extend(_disclosure_blocks(*disclosure_fields(disclosure), separator=len(card_body) > 1))
+        results.append(send_teams_card(card_body))
+    return all(results)
+
+def _title_block():
+    return {
+        "type": "TextBlock",
+        "text": "Cybersecurity Incident Disclosure",
+        "weight": "Bolder",
+        "size": "Medium"
+    }
+
+def _disclosure_blocks(company_name, cik_number, ticker_symbol, document_link, pubDate, separator=False):
+    """Adaptive card elements describing one disclosure."""
     ticker_part = f"(Ticker: [${ticker_symbol}](https://www.google.com/search?q=%24{ticker_symbol}+ticker))" if ticker_symbol else ""
     
+    return [
+        {
+            "type": "TextBlock",
+            "text": f"{pubDate}\\n\\nA cybersecurity incident has been disclosed by **{company_name}** (CIK: [{cik_number}](https://www.sec.gov/cgi-bin/browse-edgar?company=&CIK={cik_number})) {ticker_part}.",
+            "wrap": True,
+            "separator": separator
+        },
+        {
+            "type": "ActionSet",
+            "actions": [
+                {
+                    "type": "Action.OpenUrl",
+                    "title": "View SEC Filing",
+                    "url": document_link
+                }
+            ]
+        }
+    ]
+
+def send_teams_card(card_body):
+    """Post an adaptive card with the given body elements to Microsoft Teams.
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
     card_content = {
         "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
         "type": "AdaptiveCard",
         "version": "1.2",
-        "body": [
-            {
-                "type": "TextBlock",
-                "text": "Cybersecurity Incident Disclosure",
-                "weight": "Bolder",
-                "size": "Medium"
-            },
-            {
-                "type": "TextBlock",
-                "text": f"{pubDate}\\n\\nA cybersecurity incident has been disclosed by **{company_name}** (CIK: [{cik_number}](https://www.sec.gov/cgi-bin/browse-edgar?company=&CIK={cik_number})) {ticker_part}.",
-                "wrap": True
-            },
-            {
-                "type": "ActionSet",
-                "actions": [
-                    {
-                        "type": "Action.OpenUrl",
-                        "title": "View SEC Filing",
-                        "url": document_link
-                    }
-                ]
-            }
-        ]
+        "body": card_body
     }
 
     payload = {
@@ -59,23 +99,24 @@ def post_to_teams(company_name, cik_number, ticker_symbol, document_link, pubDat
 
     try:
         headers = {'Content-Type': 'application/json'}
-        response = requests.post(TEAMS_WEBHOOK_URL, json=payload, headers=headers)
+        response = SESSION.post(TEAMS_WEBHOOK_URL, json=payload, headers=headers, timeout=NOTIFICATION_TIMEOUT)
         
         if response.status_code in {200, 202}:  # Teams webhooks can return either 200 or 202
             return True
         else:
             error_text = response.text if response.text else f"Status code: {response.status_code}"
-            logger.error(f"Failed to post to Teams: {error_text}")
+            logger.error("Failed to post to Teams: %s", error_text)
             return False
             
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to post to Teams: Network error - {str(e)}")
+        logger.error("Failed to post to Teams: Network error - %s", e)
         return False
     except Exception as e:
-        logger.error(f"Failed to post to Teams: Unexpected error - {str(e)}")
+        logger.error("Failed to post to Teams: Unexpected error - %s", e)
         return False
 
 if __name__ == "__main__":
+    configure_logging()
     # Example usage
     post_to_teams(
         "Example Company",
@@ -1,25 +1,65 @@
 import requests
-from src.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
-from src.logger import logger
+from src.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, NOTIFICATION_TIMEOUT
+from src.formatting import disclosure_fields, group_messages
+from src.logger import logger, configure_logging
 
-def send_telegram_message(company_name, cik_number, ticker_symbol, document_link, pubDate):
+# Reused for every message so the connection to the Telegram Bot API stays open
+SESSION = requests.Session()
+
+# Longest message text the Telegram Bot API accepts
+MAX_MESSAGE_LENGTH = 4096
+
+def format_telegram_message(company_name, cik_number, ticker_symbol, document_link, pubDate):
     ticker_part = f", Ticker: [${ticker_symbol}](https://www.google.com/search?q=%24{ticker_symbol}+ticker)" if ticker_symbol else ""
-    message = f"{pubDate}\nA cybersecurity incident has been disclosed by `{company_name}` CIK: [{cik_number}](https://www.sec.gov/cgi-bin/browse-edgar?company=&CIK={cik_number}){ticker_part}.\n\n[View SEC Filing]({document_link})"
+    return f"{pubDate}\nA cybersecurity incident has been disclosed by `{company_name}` CIK: [{cik_number}](https://www.sec.gov/cgi-bin/browse-edgar?company=&CIK={cik_number}){ticker_part}.\n\n[View SEC Filing]({document_link})"
+
+def _send_telegram_text(message):
+    """Send one message to the configured chat.
+    Returns:
+        int: The HTTP status code, or None if the request failed
+    """
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     payload = {
         'chat_id': TELEGRAM_CHAT_ID,
         'text': message,
         'parse_mode': 'Markdown'
     }
-    response = requests.post(url, data=payload)
+    try:
+        response = SESSION.post(url, data=payload, timeout=NOTIFICATION_TIMEOUT)
+    except requests.RequestException as e:
+        logger.error("Failed to post to Telegram: %s", e)
+        return None
     if response.status_code != 200:
-        logger.error(f"Failed to post to Telegram: {response.text}")
-        return False
+        logger.error("Failed to post to Telegram: %s", response.text)
     else:
-        logger.info(f"Telegram posted successfully: {response}")
-        return True
+        logger.info("Telegram posted successfully: %s", response)
+    return response.status_code
+
+def post_telegram_text(message):
+    return _send_telegram_text(message) == 200
+
+def send_telegram_message(company_name, cik_number, ticker_symbol, document_link, pubDate):
+    return post_telegram_text(format_telegram_message(company_name, cik_number, ticker_symbol, document_link, pubDate))
+
+def send_telegram_batch(disclosures):
+    """Send several disclosures in as few Telegram messages as possible.
+    Returns:
+        bool: True if every message was sent
+    """
+    messages = [format_telegram_message(*disclosure_fields(disclosure)) for disclosure in disclosures]
+    results = []
+    for group in group_messages(messages, MAX_MESSAGE_LENGTH):
+        status = _send_telegram_text("\n\n".join(group))
+        if status == 400 and len(group) > 1:
+            # Telegram rejects the whole text if any part has malformed Markdown;
+            # send the parts one by one so only the offending disclosure is lost
+            results.extend(post_telegram_text(message) for message in group)
+        else:
+            results.append(status == 200)
+    return all(results)
 
 if __name__ == "__main__":
+    configure_logging()
     # Example usage
     send_telegram_message(
         "Example Company",
@@ -3,7 +3,8 @@ import pytz
 from datetime import datetime
 from src.config import TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_BEARER_TOKEN, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET
 from src.utils import fetch_filings_from_rss, process_disclosures
-from src.logger import logger
+from src.formatting import disclosure_fields
+from src.logger import logger, configure_logging
 
 try:
     # Initialize Tweepy API for updating bio
@@ -20,7 +21,7 @@ try:
         access_token_secret=TWITTER_ACCESS_TOKEN_SECRET
     )
 except Exception as e:
-    logger.error(f"Failed to initialize Twitter API: {e}")
+    logger.error("Failed to initialize Twitter API: %s", e)
     raise ImportError("Twitter module initialization failed") from e
 
 def update_twitter_bio(last_checked_time_utc):
@@ -31,7 +32,7 @@ def update_twitter_bio(last_checked_time_utc):
         api.update_profile(description=bio_message)
         logger.info("Twitter bio updated.")
     except Exception as e:
-        logger.critical(f"Failed to update Twitter bio: {e}")
+        logger.critical("Failed to update Twitter bio: %s", e)
 
 def tweet(company_name, cik_number, ticker_symbol, document_link, pubDate):
     if not all([company_name, cik_number, document_link, pubDate]):
@@ -48,16 +49,25 @@ def tweet(company_name, cik_number, ticker_symbol, document_link, pubDate):
 
     try:
         response = client.create_tweet(text=tweet_message)
-        logger.info(f"Tweet posted successfully: {response}")
+        logger.info("Tweet posted successfully: %s", response)
         return True
     except Exception as e:
-        logger.critical(f"Failed to post tweet: {e}")
+        logger.critical("Failed to post tweet: %s", e)
         return False
 
+def tweet_batch(disclosures):
+    """Tweet each disclosure separately, so every one stays individually shareable.
+    Returns:
+        bool: True if every tweet was posted
+    """
+    results = [tweet(*disclosure_fields(disclosure)) for disclosure in disclosures]
+    return all(results)
+
 def process_twitter_disclosures(filings):
     process_disclosures(filings, tweet)
 
 if __name__ == "__main__":
+    configure_logging()
     filings = fetch_filings_from_rss()
     process_twitter_disclosures(filings)
     update_twitter_bio(datetime.utcnow())
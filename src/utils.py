@@ -1,15 +1,147 @@
 import os
 import re
+import html
+import hashlib
 import requests
-import time
-import xmltodict
-from bs4 import BeautifulSoup
-from datetime import datetime
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from io import BytesIO
+import lxml.html
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
 import json
-from src.config import REQUEST_INTERVAL, RSS_URL, DISCLOSURES_FILE, USER_AGENT, SEARCH_TERMS
+from src.config import (
+    REQUESTS_PER_SECOND,
+    REQUEST_TIMEOUT,
+    MAX_DOCUMENT_BYTES,
+    MAX_CONCURRENT_REQUESTS,
+    RSS_URL,
+    FORM_TYPES,
+    DISCLOSURES_FILE,
+    USER_AGENT,
+    SEARCH_TERMS,
+    CACHE_DIR,
+    SUBMISSIONS_CACHE_TTL,
+    COMPANY_TICKERS_URL,
+    COMPANY_TICKERS_CACHE_TTL,
+    INSPECTIONS_CACHE_TTL,
+    CACHE_MAX_AGE,
+    CACHE_MAX_ENTRIES
+)
+from src.cache import FileCache
+from src.rate_limiter import RateLimiter
+from src.formatting import disclosure_fields
 from src.logger import logger
 from typing import Dict, Any, List, Tuple
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# orjson parses the large SEC JSON files several times faster than the json module
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Namespace of the edgar:* elements in the SEC RSS feed
+EDGAR_NS = '{https://www.sec.gov/Archives/edgar}'
+
+# Shared HTTP session so requests to the SEC reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': USER_AGENT,
+    # gzip/deflate, plus br when a brotli decoder is installed
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+})
+_sec_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+)
+SESSION.mount('https://www.sec.gov', _sec_adapter)
+SESSION.mount('https://data.sec.gov', _sec_adapter)
+
+# Shared across worker threads to stay within the SEC's fair access rate
+SEC_RATE_LIMITER = RateLimiter(rate=REQUESTS_PER_SECOND, burst=REQUESTS_PER_SECOND)
+
+# Filings parsed from the last RSS feed response, stored with its validators for
+# conditional GETs; kept on disk so an unchanged feed isn't re-fetched after a restart
+RSS_CACHE = FileCache(os.path.join(CACHE_DIR, 'rss'), ttl=0)
+_rss_entry = None
+
+# Filing documents already inspected this session, so repeated feed items are not fetched again
+_inspected_urls = set()
+
+# Scan results by document content digest, so identical documents filed under
+# different URLs (e.g. re-filed exhibits) are only parsed once
+_MAX_SCANNED_DIGESTS = 10000
+_scanned_digests = OrderedDict()
+_scanned_digests_lock = threading.Lock()
+
+# Cache of data.sec.gov submissions JSON, one entry per CIK
+SUBMISSIONS_CACHE = FileCache(os.path.join(CACHE_DIR, 'submissions'), ttl=SUBMISSIONS_CACHE_TTL,
+                              max_age=CACHE_MAX_AGE, max_entries=CACHE_MAX_ENTRIES)
+
+# Cache of document inspection results, one entry per filing document URL; expired
+# entries are never revalidated, so they are deleted as soon as they expire
+INSPECTIONS_CACHE = FileCache(os.path.join(CACHE_DIR, 'inspections'), ttl=INSPECTIONS_CACHE_TTL,
+                              max_age=INSPECTIONS_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+
+# Version of the text extraction and matching behind cached inspection results;
+# bump it whenever either changes so results from older code are not reused
+INSPECTION_VERSION = 2
+
+# Start and end tags, comments and declarations, as the HTML parser recognizes them
+# (a '<' followed by anything else is text)
+_MARKUP_RE = re.compile(rb'<[A-Za-z/!?][^>]*>')
+
+# Cache of the SEC's bulk company_tickers.json
+TICKERS_CACHE = FileCache(os.path.join(CACHE_DIR, 'tickers'), ttl=COMPANY_TICKERS_CACHE_TTL)
+
+# CIK -> primary ticker, loaded from company_tickers.json by refresh_ticker_map()
+_TICKER_MAP: Dict[int, str] = {}
+_ticker_map_day = None
+# Day the per-CIK lookups in _lookup_ticker_symbol were cached on
+_lookup_cache_day = None
+
+def fetch_cached(url, cache, key):
+    """Fetch a URL through a FileCache.
+    Fresh entries are served from disk; stale ones are revalidated with a
+    conditional GET, and an HTTP 304 counts as a cache hit.
+    Returns:
+        str: Response body, or None if it could not be fetched
+    """
+    entry = cache.get(key)
+    if cache.is_fresh(entry):
+        logger.debug("Cache hit for %s", url)
+        return entry['body']
+
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    SEC_RATE_LIMITER.acquire()
+    response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304 and entry:
+        logger.debug("Not modified, reusing cached %s", url)
+        return cache.touch(entry, key)['body']
+    if response.status_code == 200:
+        cache.set(key, response.text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.text
+
+    logger.error("Error fetching %s: HTTP %s", url, response.status_code)
+    return None
+
 def load_disclosures():
     if os.path.exists(DISCLOSURES_FILE):
         try:
@@ -20,174 +152,405 @@ def load_disclosures():
                     return list(disclosures.values())
                 return disclosures
         except (json.JSONDecodeError, TypeError):
-            logger.warning(f"{DISCLOSURES_FILE} is empty or corrupted. Initializing empty disclosures list.")
+            logger.warning("%s is empty or corrupted. Initializing empty disclosures list.", DISCLOSURES_FILE)
     return []
 
 def save_disclosures(disclosures):
     with open(DISCLOSURES_FILE, 'w') as file:
         json.dump(disclosures, file, indent=4)
-    logger.info(f"Disclosures saved to {DISCLOSURES_FILE}")
+    logger.info("Disclosures saved to %s", DISCLOSURES_FILE)
 
-def get_ticker_symbol(cik_number, company_name):
+@lru_cache(maxsize=8192)
+def _lookup_ticker_symbol(cik_number):
+    """Fetch the primary ticker for a CIK.
+    refresh_ticker_map() clears the cache daily. Failures raise instead of
+    returning None so that they are not cached.
+    """
     url = f"https://data.sec.gov/submissions/CIK{cik_number}.json"
-    headers = {'User-Agent': USER_AGENT}
+    body = fetch_cached(url, SUBMISSIONS_CACHE, f"CIK{cik_number}")
+    if body is None:
+        raise LookupError(f"Error fetching ticker symbol for CIK: {cik_number}")
+    data = json_loads(body)
+    return data.get('tickers', [])[0] if data.get('tickers') else None
+
+def refresh_ticker_map():
+    """Load the bulk CIK to ticker mapping, at most once per day.
+    Returns:
+        bool: True if the mapping is loaded and current
+    """
+    global _TICKER_MAP, _ticker_map_day, _lookup_cache_day
+    today = date.today()
+    if _lookup_cache_day != today:
+        # Tickers change; look individual CIKs up afresh each day
+        _lookup_ticker_symbol.cache_clear()
+        _lookup_cache_day = today
+    if _ticker_map_day == today:
+        return True
+
     try:
-        response = requests.get(url, headers=headers)
-        time.sleep(REQUEST_INTERVAL)
-        if response.status_code == 200:
-            data = response.json()
-            ticker_symbol = data.get('tickers', [])[0] if data.get('tickers') else None
-            return ticker_symbol
-        else:
-            logger.error(f"Error fetching ticker symbol for CIK: {cik_number}")
-            return None
+        body = fetch_cached(COMPANY_TICKERS_URL, TICKERS_CACHE, 'company_tickers')
+        if body is None:
+            return False
+
+        ticker_map = {}
+        # Entries are ordered by rank, so the first ticker seen for a CIK is its primary one
+        for entry in json_loads(body).values():
+            ticker_map.setdefault(int(entry['cik_str']), entry['ticker'])
+
+        _TICKER_MAP = ticker_map
+        _ticker_map_day = today
+        logger.info("Loaded %s tickers from company_tickers.json", len(ticker_map))
+        return True
     except Exception as e:
-        logger.error(f"Error retrieving ticker symbol: {e}")
+        logger.error("Error loading company tickers: %s", e)
+        return False
+
+def get_ticker_symbol(cik_number):
+    try:
+        ticker = _TICKER_MAP.get(int(cik_number))
+        if ticker:
+            return ticker
+        # Not in the bulk file (e.g. newly registered); ask the submissions API
+        return _lookup_ticker_symbol(cik_number)
+    except LookupError as e:
+        logger.error(str(e))
+        return None
+    except Exception as e:
+        logger.error("Error retrieving ticker symbol: %s", e)
+        return None
+
+class _HyperscanTermFinder:
+    """Multi-literal matcher backed by a Hyperscan database.
+    Scratch space cannot be shared between concurrent scans, so each worker
+    thread gets its own.
+    """
+
+    def __init__(self, terms):
+        self.terms = terms
+        self.database = hyperscan.Database()
+        self.database.compile(
+            expressions=[term.encode() for term in terms],
+            ids=list(range(len(terms))),
+            elements=len(terms),
+            # Report each term once, not every occurrence of it
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(terms),
+            literal=True
+        )
+        self._local = threading.local()
+
+    def __call__(self, text):
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.database)
+
+        found = set()
+        def on_match(term_id, start, end, flags, context):
+            found.add(self.terms[term_id])
+            # Stop scanning once every term has been seen
+            return len(found) == len(self.terms)
+
+        try:
+            self.database.scan(text.encode(), match_event_handler=on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass
+        return found
+
+@lru_cache(maxsize=None)
+def _term_finder(terms: Tuple[str, ...]):
+    """Build a function returning the lowercased terms that occur in lowercased text.
+    Uses a single Hyperscan pass when available, otherwise one str.find per term
+    (which beats a Python regex alternation on document-sized text).
+    """
+    lowered = tuple(sorted({term.lower() for term in terms}))
+    if hyperscan is not None:
+        return _HyperscanTermFinder(lowered)
+    return lambda text: {term for term in lowered if term in text}
+
+def read_limited(response, max_bytes):
+    """Read a streamed response body in chunks.
+    Returns:
+        bytes: The body, or None if it is larger than max_bytes
+    """
+    content_length = response.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        return None
+
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=65536):
+        size += len(chunk)
+        if size > max_bytes:
+            return None
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+def _scan_document(content: bytes, search_terms: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Parse a document and check it against every group of search terms.
+    Returns:
+        dict: Matching terms and context per matching group, or None if nothing matched
+    """
+    # Skip the HTML parse unless every word of some term occurs in the document with
+    # markup removed and entities decoded. Words split by tags (cyber<b>attack</b>)
+    # join up as they do in text_content(); words rather than whole phrases keep
+    # this safe when markup or whitespace separates the words of a phrase
+    rough_text = html.unescape(_MARKUP_RE.sub(b'', content).decode('latin-1')).lower()
+    if not any(
+        all(word in rough_text for word in term.lower().split())
+        for terms in search_terms.values() for term in terms
+    ):
+        logger.debug("No search term words in document text, skipping parse")
         return None
 
-def inspect_document(url: str, search_terms: List[str]) -> Tuple[bool, Dict[str, str]]:
+    try:
+        document = lxml.html.fromstring(content)
+    except etree.ParserError as e:
+        # No HTML content to scan (e.g. only comments); nothing can match
+        logger.warning("Could not parse document: %s", e)
+        return None
+    # Only scan text a reader of the filing sees: drop script and style contents (as
+    # BeautifulSoup's get_text() did), the document head, and the inline XBRL header,
+    # whose hidden facts and contexts can be a large part of the document
+    etree.strip_elements(document, 'head', 'script', 'style', 'ix:header', with_tail=False)
+    # Collapse runs of whitespace (including the &nbsp; SEC filings use between
+    # words) to single spaces, so phrases match however the source HTML wraps them
+    text = ' '.join(document.text_content().split()).lower()
+
+    results = {}
+    for group, terms in search_terms.items():
+        # Find all matching terms
+        found = _term_finder(tuple(terms))(text)
+        if not found:
+            continue
+
+        matches = [term for term in terms if term.lower() in found]
+        logger.info("Found matching terms in document: %s", ', '.join(matches))
+        # Get some context around the earliest match (for notification)
+        index, first_term = min((text.find(term), term) for term in found)
+        start = max(0, index - 100)
+        end = min(len(text), index + len(first_term) + 100)
+        results[group] = {
+            'matching_terms': matches,
+            'context': f"...{text[start:end]}..."
+        }
+
+    if not results:
+        logger.debug("No matching terms found in document")
+        return None
+    return results
+
+def _scan_document_once(content: bytes, search_terms: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Scan a document, reusing the result for content that was already scanned."""
+    # The search terms are part of the key, since the result depends on them
+    hasher = hashlib.blake2b(repr(search_terms).encode(), digest_size=16)
+    hasher.update(content)
+    digest = hasher.digest()
+    with _scanned_digests_lock:
+        if digest in _scanned_digests:
+            _scanned_digests.move_to_end(digest)
+            logger.debug("Document content already scanned, reusing result")
+            return _scanned_digests[digest]
+
+    results = _scan_document(content, search_terms)
+    with _scanned_digests_lock:
+        _scanned_digests[digest] = results
+        if len(_scanned_digests) > _MAX_SCANNED_DIGESTS:
+            _scanned_digests.popitem(last=False)
+    return results
+
+def inspect_document(url: str, search_terms: Dict[str, List[str]]) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
     """
-    Inspect a document for search terms.
+    Inspect a document for one or more groups of search terms.
+    The document is fetched and parsed once and checked against every group.
+    Results are cached on disk by URL, so a document is only downloaded again
+    once its cache entry expires or the search terms change.
     Returns a tuple of (bool, dict) where the bool indicates if any terms were found
-    and the dict contains the matching terms and context.
+    and the dict maps each matching group to its matching terms and context.
     """
-    headers = {'User-Agent': USER_AGENT}
     try:
-        logger.debug(f"Fetching document from {url}")
-        response = requests.get(url, headers=headers)
-        time.sleep(REQUEST_INTERVAL)
-        
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            text = soup.get_text().lower()
-            
-            # Find all matching terms
-            matches = []
-            for term in search_terms:
-                if term.lower() in text:
-                    matches.append(term)
-                    
-            if matches:
-                logger.info(f"Found matching terms in document: {', '.join(matches)}")
-                # Get some context around the first match (for notification)
-                first_term = matches[0].lower()
-                index = text.find(first_term)
-                start = max(0, index - 100)
-                end = min(len(text), index + len(first_term) + 100)
-                context = f"...{text[start:end]}..."
-                
-                return True, {
-                    'matching_terms': matches,
-                    'context': context
-                }
-            else:
-                logger.debug("No matching terms found in document")
+        entry = INSPECTIONS_CACHE.get(url)
+        if (INSPECTIONS_CACHE.is_fresh(entry)
+                and entry['body'].get('version') == INSPECTION_VERSION
+                and entry['body'].get('search_terms') == search_terms):
+            logger.debug("Using cached inspection of %s", url)
+            _inspected_urls.add(url)
+            results = entry['body']['results']
+            return bool(results), results
+
+        logger.debug("Fetching document from %s", url)
+        SEC_RATE_LIMITER.acquire()
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code != 200:
+                logger.error("Error fetching document: HTTP %s", response.status_code)
                 return False, None
+            content = read_limited(response, MAX_DOCUMENT_BYTES)
+
+        if content is None:
+            logger.warning("Skipping document larger than %d bytes: %s", MAX_DOCUMENT_BYTES, url)
+            results = None
         else:
-            logger.error(f"Error fetching document: HTTP {response.status_code}")
-            return False, None
+            results = _scan_document_once(content, search_terms)
+
+        # Filed documents do not change, so the outcome can be reused as is
+        INSPECTIONS_CACHE.set(url, {'version': INSPECTION_VERSION, 'search_terms': search_terms, 'results': results})
+        # Only mark the document inspected once it has been scanned, so a failed
+        # scan is retried on the next poll
+        _inspected_urls.add(url)
+        return bool(results), results
     except Exception as e:
-        logger.error(f"Error inspecting document: {e}")
+        logger.error("Error inspecting document: %s", e)
         return False, None
 
-def process_filing(filing: Dict[str, Any], search_terms: List[str]) -> Tuple[bool, List[str], str]:
-    """Process a single filing and return if it matches search terms.
+def process_filing(filing: Dict[str, Any], search_terms: Dict[str, List[str]]) -> Tuple[bool, List[str], str]:
+    """Process a single filing and return if it matches any group of search terms.
     Returns (matched, matching_terms, context)"""
     try:
-        logger.debug(f"Processing filing for {filing['company_name']} ({filing['form_type']})")
+        logger.debug("Processing filing for %s (%s)", filing['company_name'], filing['form_type'])
         
         # Inspect the filing
-        found, result = inspect_document(filing['filing_href'], search_terms)
+        found, results = inspect_document(filing['filing_href'], search_terms)
         
-        if found and result:
-            return True, result['matching_terms'], result['context']
+        if found and results:
+            # Combine matching terms and context across groups
+            matching_terms = []
+            contexts = []
+            for result in results.values():
+                matching_terms.extend(result['matching_terms'])
+                contexts.append(result['context'])
+            return True, matching_terms, "\n\n".join(contexts)
         
         return False, [], ""
             
     except Exception as e:
-        logger.error(f"Error processing filing: {e}")
+        logger.error("Error processing filing: %s", e)
         return False, [], ""
 
 def fetch_filings_from_rss():
-    headers = {'User-Agent': USER_AGENT}
+    """Fetch and parse the SEC RSS feed.
+    Uses a conditional GET, so an unchanged feed costs a 304 and the filings
+    parsed from it last time are returned without parsing again.
+    Returns:
+        list: Filings in the feed, or an empty list if it is unavailable
+    """
+    global _rss_entry
+    if _rss_entry is None:
+        _rss_entry = RSS_CACHE.get('feed')
+
+    headers = {}
+    if _rss_entry:
+        if _rss_entry.get('etag'):
+            headers['If-None-Match'] = _rss_entry['etag']
+        if _rss_entry.get('last_modified'):
+            headers['If-Modified-Since'] = _rss_entry['last_modified']
     try:
-        logger.debug(f"Requesting RSS feed from {RSS_URL}")
-        response = requests.get(RSS_URL, headers=headers)
-        time.sleep(REQUEST_INTERVAL)
+        logger.debug("Requesting RSS feed from %s", RSS_URL)
+        SEC_RATE_LIMITER.acquire()
+        response = SESSION.get(RSS_URL, headers=headers, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code == 304 and _rss_entry:
+            logger.info("RSS feed not modified since last check")
+            return _rss_entry['body']
         
         if response.status_code == 200:
             logger.debug("RSS feed fetched successfully, parsing content...")
-            feed = xmltodict.parse(response.content)
             
-            # Get items from feed structure
-            items = []
-            if 'rss' in feed and 'channel' in feed['rss']:
-                items = feed['rss']['channel'].get('item', [])
-                if not isinstance(items, list):
-                    items = [items]
-                
-                logger.debug(f"Found {len(items)} items in feed")
-                logger.debug(f"Sample item structure: {list(items[0].keys()) if items else 'No items'}")
-                
-                # Process and clean up items
-                processed_items = []
-                for item in items:
-                    try:
-                        # Extract filing info from xbrlFiling
-                        xbrl_filing = item.get('edgar:xbrlFiling', {})
-                        
-                        form_type = xbrl_filing.get('edgar:formType', '')
-                        company_name = xbrl_filing.get('edgar:companyName', '')
-                        cik = xbrl_filing.get('edgar:cikNumber', '')
-                        
-                        # Get the document URL from xbrlFiles
-                        filing_href = ''
-                        if 'edgar:xbrlFiles' in xbrl_filing:
-                            xbrl_files = xbrl_filing['edgar:xbrlFiles'].get('edgar:xbrlFile', [])
-                            if not isinstance(xbrl_files, list):
-                                xbrl_files = [xbrl_files]
-                            
-                            # Look for HTML file
-                            for xbrl_file in xbrl_files:
-                                if xbrl_file.get('@edgar:url', '').endswith(('.htm', '.html')):
-                                    filing_href = xbrl_file.get('@edgar:url', '')
-                                    break
-                        
-                        if not all([form_type, company_name, cik, filing_href]):
-                            logger.debug(f"Skipping incomplete item: {item}")
-                            continue
-                        
-                        processed_item = {
-                            'form_type': form_type,
-                            'company_name': company_name,
-                            'cik': cik,
-                            'filing_href': filing_href,
-                            'pubDate': item.get('pubDate', '')
-                        }
-                        
-                        logger.debug(f"Processed item: {processed_item}")
-                        processed_items.append(processed_item)
-                    except Exception as e:
-                        logger.error(f"Error processing feed item: {e}")
+            # Stream <item> elements instead of building the whole feed in memory
+            item_count = 0
+            processed_items = []
+            for _, item in etree.iterparse(BytesIO(response.content), tag='item'):
+                item_count += 1
+                try:
+                    # Extract filing info from xbrlFiling
+                    xbrl_filing = item.find(f'{EDGAR_NS}xbrlFiling')
+                    if xbrl_filing is None:
+                        logger.debug("Skipping item without xbrlFiling: %s", item.findtext('title'))
                         continue
-                
-                logger.debug(f"Successfully processed {len(processed_items)} items")
-                return processed_items
-            else:
-                logger.error("Unexpected feed structure")
-                logger.debug(f"Feed structure: {feed.keys()}")
-                if 'rss' in feed:
-                    logger.debug(f"Feed content keys: {feed['rss'].keys()}")
+                    
+                    form_type = (xbrl_filing.findtext(f'{EDGAR_NS}formType') or '').strip()
+                    company_name = (xbrl_filing.findtext(f'{EDGAR_NS}companyName') or '').strip()
+                    cik = (xbrl_filing.findtext(f'{EDGAR_NS}cikNumber') or '').strip()
+                    
+                    # Get the document URL from xbrlFiles, looking for the first HTML file
+                    filing_href = ''
+                    for xbrl_file in xbrl_filing.iterfind(f'{EDGAR_NS}xbrlFiles/{EDGAR_NS}xbrlFile'):
+                        file_url = xbrl_file.get(f'{EDGAR_NS}url', '')
+                        if file_url.endswith(('.htm', '.html')):
+                            filing_href = file_url
+                            break
+                    
+                    if not all([form_type, company_name, cik, filing_href]):
+                        logger.debug("Skipping incomplete item: %s", item.findtext('title'))
+                        continue
+                    
+                    processed_item = {
+                        'form_type': form_type,
+                        'company_name': company_name,
+                        'cik': cik,
+                        'filing_href': filing_href,
+                        'pubDate': (item.findtext('pubDate') or '').strip()
+                    }
+                    
+                    logger.debug("Processed item: %s", processed_item)
+                    processed_items.append(processed_item)
+                except Exception as e:
+                    logger.error("Error processing feed item: %s", e)
+                finally:
+                    # Release the parsed item and everything before it
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
+            
+            if not item_count:
+                logger.error("Unexpected feed structure: no items found")
+            logger.debug("Successfully processed %s of %s items", len(processed_items), item_count)
+            _rss_entry = RSS_CACHE.set('feed', processed_items,
+                                       response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            return processed_items
         else:
-            logger.error(f"Error fetching RSS feed: HTTP {response.status_code}")
-            logger.debug(f"Response headers: {response.headers}")
-            logger.debug(f"Response content: {response.content[:500]}")
+            logger.error("Error fetching RSS feed: HTTP %s", response.status_code)
+            logger.debug("Response headers: %s", response.headers)
+            logger.debug("Response content: %s", response.content[:500])
     except Exception as e:
-        logger.critical(f"Error fetching filings: {e}")
+        logger.critical("Error fetching filings: %s", e)
         if 'response' in locals():
-            logger.debug(f"Response content: {response.content[:500]}")
+            logger.debug("Response content: %s", response.content[:500])
     return []
 
+def inspect_filing(filing: Dict[str, Any]) -> Dict[str, Any]:
+    """Inspect a single 8-K filing for cybersecurity disclosures.
+    Args:
+        filing (dict): Filing as returned by fetch_filings_from_rss
+    Returns:
+        dict: The new disclosure, or None if the filing does not match
+    """
+    try:
+        cik_number = filing['cik']
+        filing_url = filing['filing_href']
+
+        # Check both item_105 and cybersecurity terms with a single fetch
+        found, matching_terms, context = process_filing(filing, SEARCH_TERMS)
+        if not found:
+            return None
+
+        ticker_symbol = get_ticker_symbol(cik_number)
+        ticker_part = f" ${ticker_symbol}" if ticker_symbol else ""
+        logger.info("%s\nA cybersecurity incident has been disclosed by %s%s (CIK: %s)\n\nView SEC Filing: %s",
+                    filing['pubDate'], filing['company_name'], ticker_part, cik_number, filing_url)
+        logger.info("Matching terms: %s", ', '.join(matching_terms))
+
+        return {
+            'company_name': filing['company_name'],
+            'cik': cik_number,
+            'ticker': ticker_symbol,
+            'form_type': filing['form_type'],
+            'filing_date': filing['pubDate'],
+            'filing_url': filing_url,
+            'matching_terms': matching_terms,
+            'context': context
+        }
+    except Exception as e:
+        logger.error("Error inspecting filing: %s", e)
+        return None
+
 def check_new_filings(filings):
     """Check new filings for cybersecurity disclosures.
     Args:
@@ -197,56 +560,33 @@ def check_new_filings(filings):
     """
     try:
         disclosures = load_disclosures()
-        new_disclosures = []
         
         # Create a set of existing filing URLs for faster lookup
         existing_filing_urls = {d.get('filing_url', '') for d in disclosures}
         
-        # Process each filing
+        # Forget inspected documents that have dropped out of the feed
+        _inspected_urls.intersection_update(filing['filing_href'] for filing in filings)
+        
+        # Select the filings that still need inspecting, once per document URL
+        pending_filings = {}
         for filing in filings:
-            cik_number = filing['cik']
-            form_type = filing['form_type']
             filing_url = filing['filing_href']
             
+            # Only process 8-K forms; decided before anything is fetched
+            if filing['form_type'] not in FORM_TYPES:
+                continue
+            
             # Skip if we've already processed this filing
-            if filing_url in existing_filing_urls:
-                logger.debug(f"Skipping already processed filing: {filing_url}")
+            if filing_url in existing_filing_urls or filing_url in _inspected_urls:
+                logger.debug("Skipping already processed filing: %s", filing_url)
                 continue
             
-            # Only process 8-K forms
-            if form_type in ['8-K', '8-K/A']:
-                # Check both item_105 and cybersecurity terms
-                found_105, terms_105, context_105 = process_filing(filing, SEARCH_TERMS['item_105'])
-                found_cyber, terms_cyber, context_cyber = process_filing(filing, SEARCH_TERMS['cybersecurity'])
-                
-                if found_105 or found_cyber:
-                    ticker_symbol = get_ticker_symbol(cik_number, filing['company_name'])
-                    ticker_part = f" ${ticker_symbol}" if ticker_symbol else ""
-                    logger.info(f"{filing['pubDate']}\nA cybersecurity incident has been disclosed by {filing['company_name']}{ticker_part} (CIK: {cik_number})\n\nView SEC Filing: {filing_url}")
-                    
-                    # Combine matching terms and context
-                    matching_terms = []
-                    context = ""
-                    if found_105:
-                        matching_terms.extend(terms_105)
-                        context += context_105 + "\n\n"
-                    if found_cyber:
-                        matching_terms.extend(terms_cyber)
-                        context += context_cyber
-                        
-                    logger.info(f"Matching terms: {', '.join(matching_terms)}")
-                    
-                    new_disclosure = {
-                        'company_name': filing['company_name'],
-                        'cik': cik_number,
-                        'ticker': ticker_symbol,
-                        'form_type': form_type,
-                        'filing_date': filing['pubDate'],
-                        'filing_url': filing_url,
-                        'matching_terms': matching_terms,
-                        'context': context.strip()
-                    }
-                    new_disclosures.append(new_disclosure)
+            pending_filings.setdefault(filing_url, filing)
+        
+        # Inspect filings concurrently; SEC_RATE_LIMITER keeps the request rate in check
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            results = executor.map(inspect_filing, pending_filings.values())
+            new_disclosures = [disclosure for disclosure in results if disclosure]
         
         # Save new disclosures
         if new_disclosures:
@@ -255,7 +595,7 @@ def check_new_filings(filings):
         return new_disclosures
             
     except Exception as e:
-        logger.error(f"Error checking new filings: {e}")
+        logger.error("Error checking new filings: %s", e)
         return []
 
 def process_disclosures(filings, notification_function):
@@ -270,19 +610,7 @@ def process_disclosures(filings, notification_function):
 
     for filing in filings:
         try:
-            company_name = filing.get('company_name', '')
-            cik_number = filing.get('cik', '')
-            document_link = filing.get('filing_url', '')
-            pub_date = filing.get('filing_date', '')
-            ticker_symbol = filing.get('ticker', '')
-
-            notification_function(
-                company_name,
-                cik_number,
-                ticker_symbol,
-                document_link,
-                pub_date
-            )
+            notification_function(*disclosure_fields(filing))
         except Exception as e:
-            logger.error(f"Error processing disclosure: {e}")
+            logger.error("Error processing disclosure: %s", e)
             continue